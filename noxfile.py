@@ -30,8 +30,13 @@ def _read_version() -> str:
 def tests(session: nox.Session) -> None:
     """Run the test suite with pytest using the current interpreter."""
     session.install(".[dev]")
+    # Each test module builds its own site under tmp_path, so files can be
+    # spread across pytest-xdist workers without sharing state.
     session.run(
         "pytest",
+        "-n",
+        "auto",
+        "--dist=loadfile",
         "--cov=simplicitypress",
         "--cov-report=term-missing",
     )
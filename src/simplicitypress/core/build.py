@@ -114,10 +114,12 @@ def build_site(
 
     sitemap_cfg = config.sitemap or {}
     sitemap_enabled = bool(sitemap_cfg.get("enabled", False))
-    sitemap_include_posts = bool(sitemap_cfg.get("include_posts", True))
-    sitemap_include_pages = bool(sitemap_cfg.get("include_pages", True))
-    sitemap_include_tags = bool(sitemap_cfg.get("include_tags", True))
-    sitemap_include_index = bool(sitemap_cfg.get("include_index", True))
+    # Fold the master switch into each include flag so a disabled sitemap
+    # skips entry collection entirely in the render loops below.
+    sitemap_include_posts = sitemap_enabled and bool(sitemap_cfg.get("include_posts", True))
+    sitemap_include_pages = sitemap_enabled and bool(sitemap_cfg.get("include_pages", True))
+    sitemap_include_tags = sitemap_enabled and bool(sitemap_cfg.get("include_tags", True))
+    sitemap_include_index = sitemap_enabled and bool(sitemap_cfg.get("include_index", True))
     sitemap_site_url: str | None = None
     sitemap_output_path: Path | None = None
     sitemap_exclude_patterns: Sequence[str] | None = None
@@ -161,8 +163,6 @@ def build_site(
         raise ValueError(str(exc)) from exc
 
     def add_sitemap_entry(path: str, lastmod: datetime | None = None) -> None:
-        if not sitemap_enabled:
-            return
         sitemap_entries.append(SitemapEntry(path=path, lastmod=lastmod))
 
     search_builder: SearchAssetsBuilder | None = None
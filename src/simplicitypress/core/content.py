@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from datetime import datetime
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+import os
 
 from .frontmatter import parse_front_matter_and_body
 from .markdown import render_markdown
@@ -25,6 +27,24 @@ def _normalize_tags(raw: Any, *, source: Path) -> list[str]:
     raise ValueError(msg)
 
 
+def _iter_markdown_files(directory: Path) -> Iterator[Path]:
+    """
+    Yield the ``*.md`` files directly inside ``directory``.
+
+    Uses ``os.scandir`` so file-type checks reuse the cached directory entry
+    data instead of issuing a ``stat`` per candidate. Matching follows
+    ``fnmatch`` (case-insensitive on Windows, like ``Path.glob``). A missing
+    directory yields nothing.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if fnmatch(entry.name, "*.md") and entry.is_file():
+                    yield Path(entry.path)
+    except FileNotFoundError:
+        return
+
+
 def discover_content(config: Config) -> tuple[list[Post], list[Page]]:
     """
     Scan the site's content directories and return lists of Post and Page
@@ -37,7 +57,7 @@ def discover_content(config: Config) -> tuple[list[Post], list[Page]]:
     pages_dir = config.paths.pages_dir
 
     # Discover posts
-    for path in posts_dir.glob("*.md"):
+    for path in _iter_markdown_files(posts_dir):
         metadata, body = parse_front_matter_and_body(path)
         body_html = render_markdown(body)
 
@@ -87,7 +107,7 @@ def discover_content(config: Config) -> tuple[list[Post], list[Page]]:
         )
 
     # Discover pages
-    for path in pages_dir.glob("*.md"):
+    for path in _iter_markdown_files(pages_dir):
         metadata, body = parse_front_matter_and_body(path)
         body_html = render_markdown(body)
 
@@ -8,9 +8,11 @@ from email.utils import format_datetime
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 from xml.etree.ElementTree import Element, SubElement, ElementTree
+import heapq
 import html
 import re
 
+from .fs import write_xml_if_changed
 from .models import Page, Post
 
 
@@ -271,8 +273,9 @@ def _collect_entries(
                 ),
             )
 
-    entries.sort(key=lambda e: (e.published, e.url), reverse=True)
-    return entries[: settings.max_items]
+    # Only the newest ``max_items`` entries are kept, so select them with a
+    # bounded heap instead of sorting every candidate.
+    return heapq.nlargest(settings.max_items, entries, key=lambda e: (e.published, e.url))
 
 
 def _write_rss(
@@ -311,8 +314,7 @@ def _write_rss(
     tree = ElementTree(rss_root)
     if settings.rss_output is None:
         raise FeedConfigError("RSS output path not resolved")
-    settings.rss_output.parent.mkdir(parents=True, exist_ok=True)
-    tree.write(settings.rss_output, encoding="utf-8", xml_declaration=True)
+    write_xml_if_changed(settings.rss_output, tree)
 
 
 def _write_atom(
@@ -371,8 +373,7 @@ def _write_atom(
     tree = ElementTree(feed_el)
     if settings.atom_output is None:
         raise FeedConfigError("Atom output path not resolved")
-    settings.atom_output.parent.mkdir(parents=True, exist_ok=True)
-    tree.write(settings.atom_output, encoding="utf-8", xml_declaration=True)
+    write_xml_if_changed(settings.atom_output, tree)
 
 
 def generate_feeds(
@@ -2,7 +2,10 @@
 # SPDX-License-Identifier: MIT
 from __future__ import annotations
 
+from io import BytesIO
 from pathlib import Path
+from xml.etree.ElementTree import ElementTree
+import os
 import shutil
 
 
@@ -32,3 +35,44 @@ def copy_static_tree(static_dir: Path, output_static_dir: Path) -> None:
         shutil.rmtree(output_static_dir)
 
     shutil.copytree(static_dir, output_static_dir)
+
+
+def write_bytes_if_changed(path: Path, data: bytes) -> bool:
+    """
+    Write ``data`` to ``path`` unless the file already holds identical bytes.
+
+    Skipping identical writes leaves the existing file (and its mtime)
+    untouched, so repeated builds only change outputs whose content changed.
+    Returns ``True`` when the file was written.
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def write_text_if_changed(path: Path, text: str) -> bool:
+    """
+    Write ``text`` as UTF-8 via :func:`write_bytes_if_changed`.
+
+    Newlines are translated to the platform separator, matching
+    ``Path.write_text``.
+    """
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return write_bytes_if_changed(path, text.encode("utf-8"))
+
+
+def write_xml_if_changed(path: Path, tree: ElementTree) -> bool:
+    """
+    Serialize ``tree`` as UTF-8 XML with a declaration and write it via
+    :func:`write_bytes_if_changed`.
+    """
+    buffer = BytesIO()
+    tree.write(buffer, encoding="utf-8", xml_declaration=True)
+    return write_bytes_if_changed(path, buffer.getvalue())
@@ -7,6 +7,8 @@ from typing import Any, Mapping
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
+from .fs import write_text_if_changed
+
 
 def create_environment(templates_dir: Path) -> Environment:
     """
@@ -28,10 +30,10 @@ def render_to_file(
 ) -> None:
     """
     Render the given template with the provided context and write it to target_path.
-    Ensures the parent directory exists.
+    Ensures the parent directory exists and skips the write when the file
+    already holds the rendered output.
     """
-    target_path.parent.mkdir(parents=True, exist_ok=True)
     template = env.get_template(template_name)
     html = template.render(**context)
-    target_path.write_text(html, encoding="utf-8")
+    write_text_if_changed(target_path, html)
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timezone
+import heapq
 import json
 import math
 import re
@@ -14,9 +15,15 @@ from typing import Any, Mapping, Sequence
 
 from jinja2 import Environment
 
+from .fs import write_bytes_if_changed, write_text_if_changed
 from .models import Config, Page, Post
 from .render import render_to_file
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
 TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
 WHITESPACE_RE = re.compile(r"\s+")
 TAG_RE = re.compile(r"<[^>]+>")
@@ -487,9 +494,9 @@ def _score_document_tokens(
             score /= math.sqrt(body_token_count)
         scored.append((token, score))
 
-    scored.sort(key=lambda item: (-item[1], item[0]))
     if len(scored) > max_terms:
-        return scored[:max_terms]
+        return heapq.nsmallest(max_terms, scored, key=lambda item: (-item[1], item[0]))
+    scored.sort(key=lambda item: (-item[1], item[0]))
     return scored
 
 
@@ -524,14 +531,18 @@ def _html_to_text(html: str) -> str:
 
 
 def _write_json(target: Path, payload: Mapping[str, object]) -> None:
-    target.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        # orjson emits compact, non-ASCII-escaped UTF-8 that parses to the same
+        # value as the fallback; small floats may be spelled differently
+        # (0.000051 vs 5.1e-05), so the bytes depend on whether it is installed.
+        write_bytes_if_changed(target, orjson.dumps(payload))
+        return
     serialized = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
-    target.write_text(serialized, encoding="utf-8")
+    write_text_if_changed(target, serialized)
 
 
 def _write_search_js(target: Path) -> None:
-    target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(SEARCH_APP_JS, encoding="utf-8")
+    write_text_if_changed(target, SEARCH_APP_JS)
 
 
 def _sanitize_relative_path(raw_value: object, *, default: str) -> Path:
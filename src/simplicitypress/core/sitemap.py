@@ -10,6 +10,8 @@ from typing import Iterable, Sequence
 
 from xml.etree.ElementTree import Element, ElementTree, SubElement
 
+from .fs import write_xml_if_changed
+
 
 @dataclass(frozen=True)
 class SitemapEntry:
@@ -59,9 +61,7 @@ def generate_sitemap(
             lastmod_el = SubElement(url_el, "lastmod")
             lastmod_el.text = lastmod_text
 
-    tree = ElementTree(root)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    tree.write(output_path, encoding="utf-8", xml_declaration=True)
+    write_xml_if_changed(output_path, ElementTree(root))
 
 
 def _normalize_site_url(raw_value: str) -> str:
@@ -23,6 +23,15 @@ def test_categorize_subject_fallback_other():
     assert update_changelog.categorize_subject("improve handling of foo") == "Other"
 
 
+def test_categorize_subject_prefix_variants():
+    assert update_changelog.categorize_subject("feat(ui)!: drop flag") == "Features"
+    assert update_changelog.categorize_subject("FIX!: urgent") == "Fixes"
+    assert update_changelog.categorize_subject("perf faster builds") == "Maintenance"
+    assert update_changelog.categorize_subject("fixed: typo") == "Other"
+    assert update_changelog.categorize_subject("feat!x: odd") == "Other"
+    assert update_changelog.categorize_subject("build(deps bump") == "Other"
+
+
 def test_should_skip_subject_filters():
     assert update_changelog.should_skip_subject("Merge pull request #1")
     assert update_changelog.should_skip_subject("chore(release): cut v0.1.0")
@@ -35,3 +44,86 @@ def test_normalize_text_handles_weird_spaces():
     raw = "Lineâ†’one\u202fwith\u00a0spacesâ€¯\n\n"
     normalized = update_changelog.normalize_text(raw)
     assert normalized == "Line→one with spaces \n"
+
+
+def test_partition_release_log_buckets_by_tag():
+    output = b"\n".join(
+        [
+            b"m1\tc3 b2\ttag: v0.2.0\tm1short\t2024-02-01\tMerge branch side",
+            b"c3\tc2\t\tc3short\t2024-01-30\tfeat: newer",
+            b"b2\tc2\t\tb2short\t2024-01-29\tfix: side fix",
+            b"c2\tc1\ttag: v0.1.1, tag: v0.1.0\tc2short\t2024-01-20\tdocs: guide",
+            "c1\t\t\tc1short\t2024-01-10\tinitial import \u2192 caf\u00e9".encode("utf-8"),
+        ]
+    )
+    releases = update_changelog.partition_release_log(output, ["v0.2.0", "v0.1.1", "v0.1.0"])
+
+    assert releases["v0.2.0"][0] == "2024-02-01"
+    assert [c.short_hash for c in releases["v0.2.0"][1]] == ["c3short", "b2short"]
+    assert releases["v0.1.1"] == ("2024-01-20", [])
+    assert [c.subject for c in releases["v0.1.0"][1]] == [
+        "docs: guide",
+        "initial import \u2192 caf\u00e9",
+    ]
+
+
+def test_normalize_text_line_endings():
+    assert update_changelog.normalize_text("a\r\nb\rc\r\n") == "a\nb\nc\n"
+
+
+def test_check_changelog_compares_normalized_content(tmp_path):
+    content = "# Changelog\n\n- feat: thing (abc1234)\n"
+    path = tmp_path / "CHANGELOG.md"
+    assert update_changelog.check_changelog(content, path) == ""
+
+    path.write_bytes(content.encode("utf-8"))
+    assert update_changelog.check_changelog(content, path) is None
+
+    path.write_bytes(content.replace("\n", "\r\n").encode("utf-8"))
+    assert update_changelog.check_changelog(content, path) is None
+
+    path.write_bytes(b"# Changelog\r\n\r\n- feat: other (abc1234)\r\n")
+    assert update_changelog.check_changelog(content, path) == (
+        "# Changelog\n\n- feat: other (abc1234)\n"
+    )
+
+
+def test_print_changelog_diff_caps_output(tmp_path, capsys):
+    path = tmp_path / "CHANGELOG.md"
+    existing = "".join(f"old {idx}\n" for idx in range(300))
+    content = "".join(f"new {idx}\n" for idx in range(300))
+
+    update_changelog.print_changelog_diff(content, existing, path)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == update_changelog.MAX_DIFF_LINES + 1
+    assert lines[-1] == "... 403 more diff lines omitted"
+
+
+def test_partition_release_log_lists_merged_forward_hotfix():
+    # v0.2.1 is cut from v0.2.0 on a release branch and merged into main after
+    # v0.3.0, so ``git log v0.3.0..v0.4.0`` lists the hotfix as well.
+    output = b"\n".join(
+        [
+            b"c4\tm1\ttag: v0.4.0\tc4short\t2024-03-05\tfeat: four",
+            b"m1\tc3 h1\t\tm1short\t2024-03-04\tMerge branch release-0.2",
+            b"c3\tc2\ttag: v0.3.0\tc3short\t2024-03-03\tfeat: three",
+            b"h1\tc2\ttag: v0.2.1\th1short\t2024-03-02\tfix: hotfix",
+            b"c2\t\ttag: v0.2.0\tc2short\t2024-03-01\tfeat: two",
+        ]
+    )
+    tags = ["v0.4.0", "v0.3.0", "v0.2.1", "v0.2.0"]
+    releases = update_changelog.partition_release_log(output, tags)
+
+    assert [c.subject for c in releases["v0.4.0"][1]] == ["feat: four", "fix: hotfix"]
+    assert [c.subject for c in releases["v0.3.0"][1]] == ["feat: three"]
+    assert [c.subject for c in releases["v0.2.1"][1]] == ["fix: hotfix"]
+    assert [c.subject for c in releases["v0.2.0"][1]] == ["feat: two"]
+
+
+def test_format_section_files_unknown_sections_under_other():
+    commits = [update_changelog.Commit(short_hash="abc1234", subject="odd", section="Custom")]
+
+    lines = list(update_changelog.format_section("v1.0.0 - 2024-01-01", commits))
+
+    assert lines == ["## v1.0.0 - 2024-01-01", "", "### Other", "", "- odd (abc1234)", ""]
@@ -88,3 +88,33 @@ def test_discover_content_basic(tmp_path: Path) -> None:
     assert page.show_in_nav is True
     assert page.nav_order == 10
 
+
+def test_discover_content_only_reads_top_level_markdown_files(tmp_path: Path) -> None:
+    site_root = tmp_path
+    posts_dir = site_root / "content" / "posts"
+    posts_dir.mkdir(parents=True)
+    (site_root / "content" / "pages").mkdir(parents=True)
+    (site_root / "templates").mkdir()
+
+    _write_site_toml(site_root)
+
+    post_md = dedent(
+        """\
+        +++
+        title = "Post 1"
+        date = "2025-01-02"
+        +++
+        Body of post 1.
+        """,
+    )
+    (posts_dir / "post1.md").write_text(post_md, encoding="utf-8")
+    (posts_dir / "notes.txt").write_text("not markdown", encoding="utf-8")
+    (posts_dir / "drafts.md").mkdir()
+    (posts_dir / "nested").mkdir()
+    (posts_dir / "nested" / "post2.md").write_text(post_md, encoding="utf-8")
+
+    config = load_config(site_root)
+    posts, pages = discover_content(config)
+
+    assert [post.source_path.name for post in posts] == ["post1.md"]
+    assert pages == []
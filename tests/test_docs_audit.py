@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 from pathlib import Path
+import subprocess
+import sys
 
+import pytest
 import textwrap
 
 from tools import docs_audit
@@ -74,3 +77,69 @@ def test_find_missing_docstrings_reports_public_defs(tmp_path: Path) -> None:
 def test_strip_ansi_sequences() -> None:
     text = "\x1b[1mCommands:\x1b[0m"
     assert docs_audit.strip_ansi(text) == "Commands:"
+
+
+def test_extract_python_blocks_reports_start_lines() -> None:
+    text = "intro\n```python\na = 1\n```\n\ntext\n```python no-run\nb = 2\n```\n"
+    blocks = docs_audit.extract_python_blocks(text)
+    assert [block.start_line for block in blocks] == [2, 7]
+
+
+def test_remove_no_audit_sections_drops_unbalanced_remainder() -> None:
+    source = "a<!-- no-audit -->x<!-- /no-audit -->b<!-- no-audit -->tail"
+    assert docs_audit.remove_no_audit_sections(source) == "ab"
+
+
+def test_get_cli_commands_from_app_matches_typer_names() -> None:
+    commands = docs_audit.get_cli_commands_from_app()
+    assert "build" in commands
+    assert all("_" not in command for command in commands)
+
+
+def test_extract_cli_commands_accumulates_into_given_set() -> None:
+    commands = {"init"}
+    result = docs_audit.extract_cli_commands("simplicitypress build\n", commands)
+    assert result is commands
+    assert commands == {"init", "build"}
+
+
+def test_parse_help_commands_plain_and_rich_layouts() -> None:
+    plain = [
+        "Usage: simplicitypress [OPTIONS] COMMAND [ARGS]...\n",
+        "\n",
+        "Commands:\n",
+        "  build  Build the site.\n",
+        "  serve  Serve the site.\n",
+        "Trailing text\n",
+    ]
+    rich = [
+        "╭─ Options ──╮\n",
+        "│ --help  Show this message. │\n",
+        "╰────╯\n",
+        "╭─ Commands ──╮\n",
+        "│ init   Initialize a site. │\n",
+        "│ build  Build the site.    │\n",
+        "╰────╯\n",
+        "╭─ Other ──╮\n",
+        "│ extra  Not a command.     │\n",
+    ]
+    assert docs_audit.parse_help_commands(plain) == {"build", "serve"}
+    assert docs_audit.parse_help_commands(rich) == {"init", "build"}
+
+
+def test_get_cli_commands_from_help_keeps_stderr_on_failure(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    real_popen = subprocess.Popen
+    failing = [sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(3)"]
+
+    def fake_popen(cmd, **kwargs):  # type: ignore[no-untyped-def]
+        return real_popen(failing, **kwargs)
+
+    monkeypatch.setattr(docs_audit.subprocess, "Popen", fake_popen)
+
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        docs_audit.get_cli_commands_from_help()
+
+    assert excinfo.value.returncode == 3
+    assert excinfo.value.stderr == "boom"
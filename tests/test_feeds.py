@@ -2,6 +2,9 @@
 # SPDX-License-Identifier: MIT
 from __future__ import annotations
 
+import io
+import os
+import tarfile
 from pathlib import Path
 from textwrap import dedent
 import xml.etree.ElementTree as ET
@@ -12,6 +15,122 @@ from simplicitypress.core.build import build_site
 from simplicitypress.core.config import load_config
 
 
+# Fixture sources are dedented once at import; tests only fill in placeholders.
+_SITE_TOML_TEMPLATE = dedent(
+    """\
+    [site]
+    title = "Feed Site"
+    subtitle = "Feed Subs"
+    base_url = ""
+    url = "{site_url}"
+    language = "en"
+    timezone = "UTC"
+
+    [paths]
+    content_dir = "content"
+    posts_dir = "content/posts"
+    pages_dir = "content/pages"
+    templates_dir = "templates"
+    static_dir = "static"
+    output_dir = "output"
+
+    [build]
+    posts_per_page = 10
+    include_drafts = false
+
+    [author]
+    name = "Author Name"
+    email = "author@example.com"
+
+    {feeds_block}
+    """,
+)
+
+_POST_TEMPLATE = dedent(
+    """\
+    +++
+    title = "{title}"
+    slug = "{slug}"
+    date = "{date}"
+    tags = {tags}
+    summary = "{summary}"
+    draft = {draft}
+    +++
+    Body for {title}.
+    """,
+)
+
+_ABOUT_PAGE = dedent(
+    """\
+    +++
+    title = "About"
+    slug = "about"
+    date = "2024-01-15T00:00:00"
+    +++
+    About page body.
+    """,
+)
+
+
+_POSTS = [
+    {
+        "slug": "alpha-post",
+        "title": "Alpha Post",
+        "date": "2024-05-03T10:00:00",
+        "tags": '["alpha"]',
+        "summary": "Alpha summary text.",
+        "draft": "false",
+    },
+    {
+        "slug": "featured-post",
+        "title": "Featured Post",
+        "date": "2024-04-20T12:00:00",
+        "tags": '["featured", "updates"]',
+        "summary": "Featured summary text.",
+        "draft": "false",
+    },
+    {
+        "slug": "draft-post",
+        "title": "Draft Post",
+        "date": "2024-03-15T09:00:00",
+        "tags": '["featured"]',
+        "summary": "Draft summary text.",
+        "draft": "true",
+    },
+]
+
+
+def _build_site_archive() -> bytes:
+    """
+    Pack every fixture file that does not depend on test parameters into an
+    in-memory tarball so each test unpacks them with a single extractall.
+    """
+    files: dict[str, str] = {
+        f"content/posts/{post['slug']}.md": _POST_TEMPLATE.format(**post) for post in _POSTS
+    }
+    files["content/pages/about.md"] = _ABOUT_PAGE
+    files["templates/base.html"] = (
+        "<!doctype html><html><body>{% block content %}{% endblock %}</body></html>"
+    )
+    for name in ("index", "post", "page", "tags", "tag"):
+        files[f"templates/{name}.html"] = (
+            "{% extends 'base.html' %}{% block content %}" + name.capitalize() + "{% endblock %}"
+        )
+    files["static/css/style.css"] = "body{}"
+
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as archive:
+        for name, text in files.items():
+            data = text.encode("utf-8")
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+_SITE_ARCHIVE = _build_site_archive()
+
+
 def _write_site_with_feeds(
     tmp_path: Path,
     *,
@@ -19,124 +138,44 @@ def _write_site_with_feeds(
     site_url: str = "https://example.com",
 ) -> Path:
     site_root = tmp_path
-    (site_root / "content" / "posts").mkdir(parents=True)
-    (site_root / "content" / "pages").mkdir(parents=True)
-    (site_root / "templates").mkdir()
-    (site_root / "static" / "css").mkdir(parents=True)
-
-    site_toml = dedent(
-        f"""\
-        [site]
-        title = "Feed Site"
-        subtitle = "Feed Subs"
-        base_url = ""
-        url = "{site_url}"
-        language = "en"
-        timezone = "UTC"
-
-        [paths]
-        content_dir = "content"
-        posts_dir = "content/posts"
-        pages_dir = "content/pages"
-        templates_dir = "templates"
-        static_dir = "static"
-        output_dir = "output"
-
-        [build]
-        posts_per_page = 10
-        include_drafts = false
-
-        [author]
-        name = "Author Name"
-        email = "author@example.com"
-
-        {feeds_block}
-        """,
-    )
+    with tarfile.open(fileobj=io.BytesIO(_SITE_ARCHIVE)) as archive:
+        # filter= only exists from 3.11.4; the archive holds our own fixed names.
+        if hasattr(tarfile, "data_filter"):
+            archive.extractall(site_root, filter="data")
+        else:  # pragma: no cover - Python < 3.11.4
+            archive.extractall(site_root)
+
+    site_toml = _SITE_TOML_TEMPLATE.format(site_url=site_url, feeds_block=feeds_block)
     (site_root / "site.toml").write_text(site_toml, encoding="utf-8")
+    return site_root
 
-    posts_dir = site_root / "content" / "posts"
-    posts = [
-        {
-            "slug": "alpha-post",
-            "title": "Alpha Post",
-            "date": "2024-05-03T10:00:00",
-            "tags": '["alpha"]',
-            "summary": "Alpha summary text.",
-            "draft": "false",
-        },
-        {
-            "slug": "featured-post",
-            "title": "Featured Post",
-            "date": "2024-04-20T12:00:00",
-            "tags": '["featured", "updates"]',
-            "summary": "Featured summary text.",
-            "draft": "false",
-        },
-        {
-            "slug": "draft-post",
-            "title": "Draft Post",
-            "date": "2024-03-15T09:00:00",
-            "tags": '["featured"]',
-            "summary": "Draft summary text.",
-            "draft": "true",
-        },
-    ]
-    for post in posts:
-        post_md = dedent(
-            f"""\
-            +++
-            title = "{post['title']}"
-            slug = "{post['slug']}"
-            date = "{post['date']}"
-            tags = {post['tags']}
-            summary = "{post['summary']}"
-            draft = {post['draft']}
-            +++
-            Body for {post['title']}.
-            """,
-        )
-        (posts_dir / f"{post['slug']}.md").write_text(post_md, encoding="utf-8")
 
-    pages_dir = site_root / "content" / "pages"
-    page_md = dedent(
-        """\
-        +++
-        title = "About"
-        slug = "about"
-        date = "2024-01-15T00:00:00"
-        +++
-        About page body.
-        """,
-    )
-    (pages_dir / "about.md").write_text(page_md, encoding="utf-8")
-
-    templates_dir = site_root / "templates"
-    base_html = "<!doctype html><html><body>{% block content %}{% endblock %}</body></html>"
-    (templates_dir / "base.html").write_text(base_html, encoding="utf-8")
-    (templates_dir / "index.html").write_text(
-        "{% extends 'base.html' %}{% block content %}Index{% endblock %}",
-        encoding="utf-8",
-    )
-    (templates_dir / "post.html").write_text(
-        "{% extends 'base.html' %}{% block content %}Post{% endblock %}",
-        encoding="utf-8",
-    )
-    (templates_dir / "page.html").write_text(
-        "{% extends 'base.html' %}{% block content %}Page{% endblock %}",
-        encoding="utf-8",
-    )
-    (templates_dir / "tags.html").write_text(
-        "{% extends 'base.html' %}{% block content %}Tags{% endblock %}",
-        encoding="utf-8",
-    )
-    (templates_dir / "tag.html").write_text(
-        "{% extends 'base.html' %}{% block content %}Tag{% endblock %}",
-        encoding="utf-8",
-    )
-
-    (site_root / "static" / "css" / "style.css").write_text("body{}", encoding="utf-8")
-    return site_root
+def _collect_item_text(
+    path: Path,
+    *,
+    item_tag: str,
+    child_tag: str,
+) -> tuple[str | None, list[str | None]]:
+    """
+    Stream ``path`` once, returning the root tag and the text of each
+    ``child_tag`` found inside an ``item_tag`` element.
+    """
+    root_tag: str | None = None
+    in_item = False
+    values: list[str | None] = []
+    for event, el in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            if root_tag is None:
+                root_tag = el.tag
+            if el.tag == item_tag:
+                in_item = True
+            continue
+        if el.tag == item_tag:
+            in_item = False
+        elif in_item and el.tag == child_tag:
+            values.append(el.text)
+        el.clear()
+    return root_tag, values
 
 
 def test_feeds_disabled_outputs_nothing(tmp_path: Path) -> None:
@@ -192,25 +231,19 @@ def test_feeds_generate_rss_and_atom(tmp_path: Path) -> None:
     assert rss_path.exists()
     assert atom_path.exists()
 
-    rss_tree = ET.parse(rss_path)
-    rss_root = rss_tree.getroot()
-    assert rss_root.tag == "rss"
-    channel = rss_root.find("channel")
-    assert channel is not None
-    rss_links = [item.findtext("link") for item in channel.findall("item")]
+    rss_root_tag, rss_links = _collect_item_text(rss_path, item_tag="item", child_tag="link")
+    assert rss_root_tag == "rss"
     assert "https://example.com/posts/alpha-post/" in rss_links
     assert "https://example.com/about/" in rss_links  # page included due to include_pages
 
-    atom_tree = ET.parse(atom_path)
-    atom_root = atom_tree.getroot()
-    assert atom_root.tag == "{http://www.w3.org/2005/Atom}feed"
-    atom_entries = atom_root.findall("{http://www.w3.org/2005/Atom}entry")
-    assert atom_entries, "Atom feed should contain entries"
-    atom_titles = [
-        entry.find("{http://www.w3.org/2005/Atom}title").text
-        for entry in atom_entries
-        if entry.find("{http://www.w3.org/2005/Atom}title") is not None
-    ]
+    atom_ns = "{http://www.w3.org/2005/Atom}"
+    atom_root_tag, atom_titles = _collect_item_text(
+        atom_path,
+        item_tag=f"{atom_ns}entry",
+        child_tag=f"{atom_ns}title",
+    )
+    assert atom_root_tag == f"{atom_ns}feed"
+    assert atom_titles, "Atom feed should contain entries"
     assert "Featured Post" in atom_titles
 
 
@@ -235,14 +268,15 @@ def test_feeds_max_items_and_filters_are_deterministic(tmp_path: Path) -> None:
     build_site(config)
     rss_path = site_root / "output" / "rss.xml"
     assert rss_path.exists()
-    first_pass = rss_path.read_text(encoding="utf-8")
+    # Pin a known mtime so an identical rebuild is detectable without
+    # re-reading the feed: unchanged output is never rewritten.
+    os.utime(rss_path, ns=(1_000_000_000, 1_000_000_000))
 
     # Run again to ensure deterministic output.
     build_site(config)
-    second_pass = rss_path.read_text(encoding="utf-8")
-    assert first_pass == second_pass
+    assert rss_path.stat().st_mtime_ns == 1_000_000_000
 
-    rss_tree = ET.fromstring(first_pass)
+    rss_tree = ET.fromstring(rss_path.read_bytes())
     channel = rss_tree.find("channel")
     assert channel is not None
     items = channel.findall("item")
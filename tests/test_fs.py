@@ -2,9 +2,10 @@
 # SPDX-License-Identifier: MIT
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
-from simplicitypress.core.fs import copy_static_tree, ensure_directory
+from simplicitypress.core.fs import copy_static_tree, ensure_directory, write_bytes_if_changed
 
 
 def test_ensure_directory_creates_parents(tmp_path: Path) -> None:
@@ -51,3 +52,17 @@ def test_copy_static_tree_replaces_existing_output_tree(tmp_path: Path) -> None:
     assert not (output_static_dir / "old" / "old.txt").exists()
     assert (output_static_dir / "css" / "style.css").read_text(encoding="utf-8") == "body{}"
 
+
+def test_write_bytes_if_changed_skips_identical_content(tmp_path: Path) -> None:
+    """write_bytes_if_changed should leave identical files (and mtimes) untouched."""
+    target = tmp_path / "nested" / "out.xml"
+
+    assert write_bytes_if_changed(target, b"<a/>") is True
+    assert target.read_bytes() == b"<a/>"
+
+    os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+    assert write_bytes_if_changed(target, b"<a/>") is False
+    assert target.stat().st_mtime_ns == 1_000_000_000
+
+    assert write_bytes_if_changed(target, b"<b/>") is True
+    assert target.read_bytes() == b"<b/>"
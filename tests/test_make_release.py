@@ -58,3 +58,17 @@ def test_git_commit_and_tag_commits_when_files_present(monkeypatch):
     assert any(cmd.startswith("git add") for cmd in commands)
     assert any(cmd.startswith("git commit") for cmd in commands)
     assert any(cmd.startswith("git tag") for cmd in commands)
+
+
+def test_run_spawns_without_stdin(monkeypatch):
+    captured: dict[str, object] = {}
+
+    def fake_subprocess_run(cmd, **kwargs):
+        captured.update(kwargs)
+        return SimpleNamespace(stdout="", stderr="")
+
+    monkeypatch.setattr(make_release.subprocess, "run", fake_subprocess_run)
+    make_release.run(["git", "status"], capture_output=True)
+    assert captured["stdin"] is make_release.subprocess.DEVNULL
+    assert captured["close_fds"] is False
+    assert captured["stdout"] is make_release.subprocess.PIPE
@@ -6,6 +6,9 @@ import json
 from pathlib import Path
 from textwrap import dedent
 
+import pytest
+
+from simplicitypress.core import search_index
 from simplicitypress.core.build import build_site
 from simplicitypress.core.config import load_config
 from simplicitypress.core.search_index import SearchSettings, should_drop_token, tokenize_text
@@ -109,6 +112,24 @@ def test_normalization_toggle_affects_scores(tmp_path: Path) -> None:
     assert python_non_norm[0][1] == python_non_norm[1][1]
 
 
+def test_write_json_fallback_matches_orjson(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pytest.importorskip("orjson")
+    payload = {
+        "docs": [{"id": 0, "title": "Café", "score": 0.123456}],
+        "terms": {"a": [[0, round(5.12345e-05, 6)]]},
+        "doc_count": 1,
+    }
+
+    fast_target = tmp_path / "fast.json"
+    search_index._write_json(fast_target, payload)
+
+    monkeypatch.setattr(search_index, "orjson", None)
+    slow_target = tmp_path / "slow.json"
+    search_index._write_json(slow_target, payload)
+
+    assert json.loads(fast_target.read_bytes()) == json.loads(slow_target.read_bytes())
+
+
 def _prepare_search_enabled_site(site_root: Path, *, normalize_by_doc_len: bool = True) -> Path:
     site_root.mkdir(parents=True, exist_ok=True)
     posts_dir = site_root / "content" / "posts"
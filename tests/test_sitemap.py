@@ -12,6 +12,67 @@ from simplicitypress.core.build import build_site
 from simplicitypress.core.config import load_config
 
 
+# Fixture sources are dedented once at import; tests only fill in placeholders.
+_SITE_TOML_TEMPLATE = dedent(
+    """\
+    [site]
+    title = "Sitemap Site"
+    subtitle = ""
+    base_url = ""
+    url = "{site_url}"
+    language = "en"
+    timezone = "UTC"
+
+    [paths]
+    content_dir = "content"
+    posts_dir = "content/posts"
+    pages_dir = "content/pages"
+    templates_dir = "templates"
+    static_dir = "static"
+    output_dir = "output"
+
+    [build]
+    posts_per_page = 10
+    include_drafts = false
+
+    [author]
+    name = ""
+    email = ""
+
+    [sitemap]
+    enabled = {sitemap_enabled}
+    output = "sitemap.xml"
+    include_tags = true
+    include_pages = true
+    include_posts = true
+    include_index = true
+    exclude_paths = []
+    """,
+)
+
+_POST_MD = dedent(
+    """\
+    +++
+    title = "Example Post"
+    date = "2025-01-02"
+    slug = "example-post"
+    tags = ["Alpha"]
+    +++
+    Body.
+    """,
+)
+
+_PAGE_MD = dedent(
+    """\
+    +++
+    title = "About"
+    slug = "about"
+    +++
+    About page body.
+    """,
+)
+
+
 def _write_minimal_site(
     tmp_path: Path,
     *,
@@ -24,67 +85,14 @@ def _write_minimal_site(
     (site_root / "templates").mkdir()
     (site_root / "static" / "css").mkdir(parents=True)
 
-    site_toml = dedent(
-        f"""\
-        [site]
-        title = "Sitemap Site"
-        subtitle = ""
-        base_url = ""
-        url = "{site_url}"
-        language = "en"
-        timezone = "UTC"
-
-        [paths]
-        content_dir = "content"
-        posts_dir = "content/posts"
-        pages_dir = "content/pages"
-        templates_dir = "templates"
-        static_dir = "static"
-        output_dir = "output"
-
-        [build]
-        posts_per_page = 10
-        include_drafts = false
-
-        [author]
-        name = ""
-        email = ""
-
-        [sitemap]
-        enabled = {"true" if sitemap_enabled else "false"}
-        output = "sitemap.xml"
-        include_tags = true
-        include_pages = true
-        include_posts = true
-        include_index = true
-        exclude_paths = []
-        """,
+    site_toml = _SITE_TOML_TEMPLATE.format(
+        site_url=site_url,
+        sitemap_enabled="true" if sitemap_enabled else "false",
     )
     (site_root / "site.toml").write_text(site_toml, encoding="utf-8")
 
-    post_md = dedent(
-        """\
-        +++
-        title = "Example Post"
-        date = "2025-01-02"
-        slug = "example-post"
-        tags = ["Alpha"]
-        +++
-        Body.
-        """,
-    )
-    (site_root / "content" / "posts" / "post1.md").write_text(post_md, encoding="utf-8")
-
-    page_md = dedent(
-        """\
-        +++
-        title = "About"
-        slug = "about"
-        +++
-        About page body.
-        """,
-    )
-    (site_root / "content" / "pages" / "about.md").write_text(page_md, encoding="utf-8")
+    (site_root / "content" / "posts" / "post1.md").write_text(_POST_MD, encoding="utf-8")
+    (site_root / "content" / "pages" / "about.md").write_text(_PAGE_MD, encoding="utf-8")
 
     (site_root / "templates" / "base.html").write_text(
         "<!doctype html><html><body>{% block content %}{% endblock %}</body></html>",
@@ -131,21 +139,25 @@ def test_sitemap_generated_with_expected_entries(tmp_path: Path) -> None:
     sitemap_path = site_root / "output" / "sitemap.xml"
     assert sitemap_path.exists()
 
-    tree = ET.parse(sitemap_path)
-    root = tree.getroot()
     ns = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
-    assert root.tag == f"{ns}urlset"
-
-    url_elements = root.findall(f"{ns}url")
+    root_tag: str | None = None
     locs: list[str] = []
     lastmod_map: dict[str, str | None] = {}
-    for url_el in url_elements:
-        loc_el = url_el.find(f"{ns}loc")
-        assert loc_el is not None
-        loc_text = loc_el.text or ""
-        locs.append(loc_text)
-        lastmod_el = url_el.find(f"{ns}lastmod")
-        lastmod_map[loc_text] = lastmod_el.text if lastmod_el is not None else None
+    current_loc: str | None = None
+    for event, el in ET.iterparse(sitemap_path, events=("start", "end")):
+        if event == "start":
+            if root_tag is None:
+                root_tag = el.tag
+            continue
+        if el.tag == f"{ns}loc":
+            current_loc = el.text or ""
+            locs.append(current_loc)
+            lastmod_map[current_loc] = None
+        elif el.tag == f"{ns}lastmod":
+            assert current_loc is not None
+            lastmod_map[current_loc] = el.text
+        el.clear()
+    assert root_tag == f"{ns}urlset"
 
     expected_locs = [
         "https://example.com/",
@@ -98,3 +98,86 @@ def test_conflict_detected_for_non_mit_license() -> None:
     assert added is False
     assert conflict is True
     assert new_text == text
+
+
+def test_insert_after_shebang_preserves_crlf() -> None:
+    text = "#!/usr/bin/env python3\r\nprint('hi')\r\n"
+    new_text, added, conflict = apply_spdx_to_text(text, DEFAULT_YEAR, DEFAULT_HOLDER)
+
+    assert added is True
+    assert new_text == (
+        "#!/usr/bin/env python3\r\n"
+        "# SPDX-FileCopyrightText: 2024 SimplicityPress contributors\r\n"
+        "# SPDX-License-Identifier: MIT\r\n"
+        "print('hi')\r\n"
+    )
+
+
+def test_insert_after_encoding_cookie_with_mixed_line_endings() -> None:
+    text = "#!/usr/bin/env python3\r\n# coding: utf-8\nx = 1\r\n"
+    new_text, added, conflict = apply_spdx_to_text(text, DEFAULT_YEAR, DEFAULT_HOLDER)
+
+    assert added is True
+    assert new_text == (
+        "#!/usr/bin/env python3\r\n"
+        "# coding: utf-8\n"
+        "# SPDX-FileCopyrightText: 2024 SimplicityPress contributors\r\n"
+        "# SPDX-License-Identifier: MIT\r\n"
+        "x = 1\r\n"
+    )
+
+
+def test_process_files_counts_and_fixes(tmp_path: Path) -> None:
+    present = tmp_path / "present.py"
+    present.write_text(f"# SPDX-FileCopyrightText: 2023 Someone\n{SPDX_LICENSE_LINE}\n", encoding="utf-8")
+    missing = tmp_path / "missing.py"
+    missing.write_text("print('hi')\n", encoding="utf-8")
+    conflict = tmp_path / "conflict.py"
+    conflict.write_text("# SPDX-License-Identifier: MIT-0\n", encoding="utf-8")
+
+    stats = add_spdx_headers.process_files(
+        [present, missing, conflict],
+        fix=True,
+        holder=DEFAULT_HOLDER,
+        year=DEFAULT_YEAR,
+    )
+
+    assert (stats.already_present, stats.missing, stats.added, stats.conflicts) == (1, 1, 1, 1)
+    assert missing.read_text(encoding="utf-8").startswith("# SPDX-FileCopyrightText: 2024")
+
+
+def test_gather_target_files_prunes_excluded_dirs(tmp_path: Path) -> None:
+    pkg = tmp_path / "src" / "simplicitypress"
+    (pkg / "core").mkdir(parents=True)
+    (pkg / "__pycache__").mkdir()
+    (pkg / "templates").mkdir()
+    (pkg / "core" / "build.py").write_text("", encoding="utf-8")
+    (pkg / "__pycache__" / "cached.py").write_text("", encoding="utf-8")
+    (pkg / "templates" / "helper.py").write_text("", encoding="utf-8")
+    (tmp_path / "tools" / "nested").mkdir(parents=True)
+    (tmp_path / "tools" / "tool.py").write_text("", encoding="utf-8")
+    (tmp_path / "tools" / "nested" / "deep.py").write_text("", encoding="utf-8")
+    (tmp_path / "noxfile.py").write_text("", encoding="utf-8")
+
+    targets = add_spdx_headers.gather_target_files(tmp_path)
+
+    assert [p.relative_to(tmp_path).as_posix() for p in targets] == [
+        "noxfile.py",
+        "src/simplicitypress/core/build.py",
+        "tools/tool.py",
+    ]
+
+
+def test_gather_target_files_sorts_relative_root(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tools").mkdir()
+    (tmp_path / "tests" / "test_a.py").write_text("", encoding="utf-8")
+    (tmp_path / "tools" / "tool.py").write_text("", encoding="utf-8")
+    (tmp_path / "noxfile.py").write_text("", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    targets = add_spdx_headers.gather_target_files(Path("."))
+
+    assert [p.as_posix() for p in targets] == ["noxfile.py", "tests/test_a.py", "tools/tool.py"]
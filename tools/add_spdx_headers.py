@@ -5,15 +5,22 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import datetime as dt
 from dataclasses import dataclass
+import os
 from pathlib import Path
 import re
-from typing import Iterable
+from typing import Iterable, Iterator
 
 SPDX_LICENSE_LINE = "# SPDX-License-Identifier: MIT"
 ENCODING_RE = re.compile(r"^#.*coding[:=]\s*([-_.a-zA-Z0-9]+)")
 LICENSE_LINE_RE = re.compile(r"^#\s*SPDX-License-Identifier:\s*(.+)$", re.MULTILINE)
+LICENSE_LINE_BYTES_RE = re.compile(rb"^#\s*SPDX-License-Identifier:\s*(.+)$", re.MULTILINE)
+LICENSE_MARKER_BYTES = b"SPDX-License-Identifier:"
+SPDX_LICENSE_LINE_BYTES = SPDX_LICENSE_LINE.encode("ascii")
+HEAD_BYTES = 2048
+NEWLINE_RE = re.compile(r"\r\n?|\n")
 EXCLUDED_PARTS = {
     ".git",
     ".mypy_cache",
@@ -48,51 +55,76 @@ def apply_spdx_to_text(text: str, year: int, holder: str) -> tuple[str, bool, bo
             return text, False, False
         return text, False, True
 
-    lines = text.splitlines(keepends=True)
-    insert_at = _find_insert_index(lines)
-    header_lines = [
-        f"# SPDX-FileCopyrightText: {year} {holder}{newline}",
-        f"{SPDX_LICENSE_LINE}{newline}",
-    ]
-    new_content = "".join(lines[:insert_at] + header_lines + lines[insert_at:])
+    insert_at = _find_insert_index(text)
+    header = f"# SPDX-FileCopyrightText: {year} {holder}{newline}{SPDX_LICENSE_LINE}{newline}"
+    new_content = text[:insert_at] + header + text[insert_at:]
     return new_content, True, False
 
 
 def _detect_newline(text: str) -> str:
-    if "\r\n" in text:
-        return "\r\n"
-    if "\r" in text:
-        return "\r"
+    """Return the first line terminator in ``text``, defaulting to ``\\n``."""
+    match = NEWLINE_RE.search(text)
+    if match:
+        return match.group()
     return "\n"
 
 
-def _find_insert_index(lines: list[str]) -> int:
+def _line_end(text: str, start: int) -> int:
+    """Return the offset just past the line starting at ``start``.
+
+    Any of ``\n``, ``\r\n`` or a bare ``\r`` ends a line, so files with
+    mixed line endings split the same way ``splitlines`` would.
+    """
+    match = NEWLINE_RE.search(text, start)
+    if match is None:
+        return len(text)
+    return match.end()
+
+
+def _find_insert_index(text: str) -> int:
+    """Return the offset after any leading shebang or encoding-cookie lines."""
+    first_end = _line_end(text, 0)
     insert_at = 0
-    if lines and lines[0].startswith("#!"):
-        insert_at = 1
+    if text.startswith("#!"):
+        insert_at = first_end
 
-    for i in range(min(len(lines), 2)):
-        if ENCODING_RE.search(lines[i]):
-            insert_at = max(insert_at, i + 1)
+    if ENCODING_RE.search(text[:first_end]):
+        insert_at = first_end
+    if first_end < len(text):
+        second_end = _line_end(text, first_end)
+        if ENCODING_RE.search(text[first_end:second_end]):
+            insert_at = second_end
 
     return insert_at
 
 
 def _find_existing_license(text: str) -> str | None:
+    if "SPDX-License-Identifier:" not in text:
+        return None
     match = LICENSE_LINE_RE.search(text)
     if match:
         return match.group(1).strip()
     return None
 
 
-def _should_skip(path: Path, root: Path) -> bool:
-    rel_parts = path.relative_to(root).parts
-    for part in rel_parts:
-        if part in EXCLUDED_PARTS:
-            return True
-        if part.endswith(".egg-info"):
-            return True
-    return False
+def _is_excluded_dir(name: str) -> bool:
+    return name in EXCLUDED_PARTS or name.endswith(".egg-info")
+
+
+def _scandir_py(base: Path, *, recursive: bool) -> Iterator[Path]:
+    """
+    Yield ``*.py`` files under ``base``, pruning excluded directories before
+    descending so trees like ``.venv`` or ``__pycache__`` are never listed.
+    """
+    stack = [os.fspath(base)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive and not _is_excluded_dir(entry.name):
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py") and entry.is_file():
+                    yield Path(entry.path)
 
 
 def gather_target_files(root: Path) -> list[Path]:
@@ -103,25 +135,19 @@ def gather_target_files(root: Path) -> list[Path]:
         (root / "tools", False),
     ]
     for base, recursive in include_roots:
-        if not base.exists():
+        if not base.is_dir():
             continue
-        iterator: Iterable[Path]
-        if recursive:
-            iterator = base.rglob("*.py")
-        else:
-            iterator = base.glob("*.py")
-        for path in iterator:
-            if not path.is_file():
-                continue
-            if _should_skip(path, root):
-                continue
-            targets.append(path)
+        targets.extend(_scandir_py(base, recursive=recursive))
 
     nox_file = root / "noxfile.py"
     if nox_file.exists():
         targets.append(nox_file)
 
-    return sorted(targets, key=lambda p: p.relative_to(root).as_posix())
+    # Sort on precomputed POSIX-style relative keys without building Paths;
+    # relpath copes with roots such as "." that pathlib collapses away.
+    decorated = [(os.path.relpath(path, root).replace(os.sep, "/"), path) for path in targets]
+    decorated.sort()
+    return [path for _, path in decorated]
 
 
 def _read_text(path: Path) -> str:
@@ -129,11 +155,67 @@ def _read_text(path: Path) -> str:
         return fh.read()
 
 
+def _head_has_mit_license(path: Path) -> bool:
+    """
+    Return True when the first license line sits in the file head and is MIT.
+
+    Lets files that already carry the header skip the full read and decode.
+    """
+    with path.open("rb") as fh:
+        head = fh.read(HEAD_BYTES)
+
+    marker = head.find(LICENSE_MARKER_BYTES)
+    if marker == -1:
+        return False
+
+    # Fast path: the first marker belongs to a canonical "# SPDX-...: MIT"
+    # line, so it is also the first line the regex would match.
+    line_start = marker - 2
+    line_end = line_start + len(SPDX_LICENSE_LINE_BYTES)
+    if (
+        line_start >= 0
+        and (line_start == 0 or head[line_start - 1] in b"\r\n")
+        and head.startswith(SPDX_LICENSE_LINE_BYTES, line_start)
+        and head[line_end : line_end + 1] in (b"\r", b"\n")
+    ):
+        return True
+
+    match = LICENSE_LINE_BYTES_RE.search(head)
+    # A match running to the end of the buffer may be a truncated line.
+    if match is None or match.end() >= len(head):
+        return False
+    return match.group(1).strip() == b"MIT"
+
+
 def _write_text(path: Path, content: str) -> None:
     with path.open("w", encoding="utf-8", newline="") as fh:
         fh.write(content)
 
 
+def _process_one(path: Path, *, fix: bool, holder: str, year: int) -> tuple[str, bool]:
+    """
+    Check (and optionally fix) a single file.
+
+    Returns the outcome (``"present"``, ``"conflict"`` or ``"missing"``) and
+    whether a header was added to the file on disk.
+    """
+    if _head_has_mit_license(path):
+        return "present", False
+
+    text = _read_text(path)
+    new_text, added, conflict = apply_spdx_to_text(text, year, holder)
+
+    if conflict:
+        return "conflict", False
+
+    if added:
+        if fix and new_text != text:
+            _write_text(path, new_text)
+        return "missing", fix
+
+    return "present", False
+
+
 def process_files(
     paths: Iterable[Path],
     *,
@@ -142,23 +224,23 @@ def process_files(
     year: int,
 ) -> SPDXStats:
     stats = SPDXStats()
-    for path in paths:
-        text = _read_text(path)
-        new_text, added, conflict = apply_spdx_to_text(text, year, holder)
-
-        if conflict:
-            stats.conflicts += 1
-            continue
-
-        if added:
-            stats.missing += 1
-            if fix:
-                if new_text != text:
-                    _write_text(path, new_text)
-                stats.added += 1
-            continue
-
-        stats.already_present += 1
+    # Per-file work is dominated by file I/O, so overlap it across threads.
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_process_one, path, fix=fix, holder=holder, year=year)
+            for path in paths
+        ]
+        for future in as_completed(futures):
+            outcome, added = future.result()
+            if outcome == "conflict":
+                stats.conflicts += 1
+            elif outcome == "missing":
+                stats.missing += 1
+                if added:
+                    stats.added += 1
+            else:
+                stats.already_present += 1
 
     return stats
 
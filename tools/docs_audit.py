@@ -20,16 +20,19 @@ import re
 import subprocess
 import sys
 import tempfile
-from typing import Iterable, Sequence
+from typing import Iterable, Mapping, Sequence
 
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 SRC_DIR = REPO_ROOT / "src"
 NO_AUDIT_BEGIN = "<!-- no-audit -->"
 NO_AUDIT_END = "<!-- /no-audit -->"
+NO_AUDIT_PATTERN = re.compile(re.escape(NO_AUDIT_BEGIN) + r".*?" + re.escape(NO_AUDIT_END), re.DOTALL)
 CLI_PATTERN = re.compile(r"simplicitypress\s+([a-zA-Z0-9_-]+)")
 PY_BLOCK_PATTERN = re.compile(r"```python(?P<info>[^\n]*)\n(?P<body>.*?)```", re.DOTALL)
 ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
+BOX_BOTTOM_LEFT = "\u2570"
+BOX_DRAWING_TO_SPACE = str.maketrans(dict.fromkeys("\u2500\u2502\u256d\u256e\u256f\u2570", " "))
 
 
 @dataclass
@@ -60,29 +63,25 @@ def remove_no_audit_sections(text: str) -> str:
 
     Content between ``<!-- no-audit -->`` and ``<!-- /no-audit -->`` is ignored.
     """
-    result: list[str] = []
-    cursor = 0
-    while cursor < len(text):
-        start = text.find(NO_AUDIT_BEGIN, cursor)
-        if start == -1:
-            result.append(text[cursor:])
-            break
-        result.append(text[cursor:start])
-        end = text.find(NO_AUDIT_END, start)
-        if end == -1:
-            # Unbalanced marker; drop the remainder.
-            break
-        cursor = end + len(NO_AUDIT_END)
-    return "".join(result)
+    if NO_AUDIT_BEGIN not in text:
+        return text
+    result = NO_AUDIT_PATTERN.sub("", text)
+    # Any opening marker left over is unbalanced; drop the remainder.
+    dangling = result.find(NO_AUDIT_BEGIN)
+    if dangling != -1:
+        return result[:dangling]
+    return result
 
 
-def extract_cli_commands(text: str) -> set[str]:
+def extract_cli_commands(text: str, commands: set[str] | None = None) -> set[str]:
     """
     Extract CLI commands referenced via ``simplicitypress <command>``.
 
-    Options such as ``--help`` are ignored.
+    Options such as ``--help`` are ignored. When ``commands`` is given, matches
+    are added to it in place and the same set is returned.
     """
-    commands: set[str] = set()
+    if commands is None:
+        commands = set()
     for match in CLI_PATTERN.finditer(text):
         command = match.group(1)
         if not command or command.startswith("-"):
@@ -91,13 +90,16 @@ def extract_cli_commands(text: str) -> set[str]:
     return commands
 
 
-def read_markdown_commands(paths: Iterable[Path]) -> set[str]:
-    """Return CLI commands referenced across provided Markdown files."""
+def read_markdown_texts(paths: Iterable[Path]) -> dict[Path, str]:
+    """Read each Markdown file once, keyed by path."""
+    return {file_path: file_path.read_text(encoding="utf-8") for file_path in paths}
+
+
+def read_markdown_commands(texts: Mapping[Path, str]) -> set[str]:
+    """Return CLI commands referenced across the provided Markdown texts."""
     commands: set[str] = set()
-    for file_path in paths:
-        text = file_path.read_text(encoding="utf-8")
-        cleaned = remove_no_audit_sections(text)
-        commands.update(extract_cli_commands(cleaned))
+    for text in texts.values():
+        extract_cli_commands(remove_no_audit_sections(text), commands)
     return commands
 
 
@@ -118,7 +120,9 @@ def get_cli_commands_from_app() -> set[str]:
         name = getattr(info, "name", None)
         if not name:
             callback = getattr(info, "callback", None)
-            name = getattr(callback, "__name__", None)
+            callback_name = getattr(callback, "__name__", None)
+            # Typer derives default command names as lower-case with dashes.
+            name = callback_name.lower().replace("_", "-") if callback_name else None
         if name:
             commands.add(name)
     return commands
@@ -127,6 +131,10 @@ def get_cli_commands_from_app() -> set[str]:
 def get_cli_commands_from_help() -> set[str]:
     """
     Run ``simplicitypress --help`` and parse the Commands section.
+
+    Output is parsed line by line straight from the pipe; stderr goes to a
+    temporary file so it cannot fill up and stall the child, and is attached
+    to the ``CalledProcessError`` if ``--help`` fails.
     """
     env = os.environ.copy()
     src_entries = [str(SRC_DIR)]
@@ -134,24 +142,53 @@ def get_cli_commands_from_help() -> set[str]:
     if existing:
         src_entries.append(existing)
     env["PYTHONPATH"] = os.pathsep.join(src_entries)
-    # Disable color/box drawing to keep parsing simple.
+    # Disable color to keep parsing simple; box drawing is handled by the parser.
     env.setdefault("NO_COLOR", "1")
-    result = subprocess.run(
-        [sys.executable, "-m", "simplicitypress", "--help"],
-        check=True,
-        capture_output=True,
-        text=True,
-        cwd=REPO_ROOT,
-        env=env,
-    )
+    env["PYTHONIOENCODING"] = "utf-8"
+    cmd = [sys.executable, "-m", "simplicitypress", "--help"]
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8", errors="replace") as stderr:
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            cwd=REPO_ROOT,
+            env=env,
+        ) as proc:
+            assert proc.stdout is not None
+            commands = parse_help_commands(proc.stdout)
+            # Drain the rest so the child never blocks on a full pipe.
+            for _ in proc.stdout:
+                pass
+        if proc.returncode:
+            stderr.seek(0)
+            raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr.read())
+    if not commands:
+        msg = "Failed to parse commands from `simplicitypress --help` output."
+        raise RuntimeError(msg)
+    return commands
+
+
+def parse_help_commands(lines: Iterable[str]) -> set[str]:
+    """
+    Collect command names from the Commands section of ``--help`` output.
+
+    Stops consuming ``lines`` once the section ends. Both the plain Click
+    layout and Typer's Rich panel layout (box-drawn sections) are understood.
+    """
     commands: set[str] = set()
     in_commands = False
-    for raw_line in result.stdout.splitlines():
-        line = strip_ansi(raw_line)
+    for raw_line in lines:
+        plain = strip_ansi(raw_line).rstrip("\r\n")
+        if in_commands and plain.startswith(BOX_BOTTOM_LEFT):
+            break
+        line = plain.translate(BOX_DRAWING_TO_SPACE)
         stripped = line.strip()
         if not stripped:
             continue
-        if stripped.lower() == "commands:":
+        if stripped.lower() in ("commands:", "commands"):
             in_commands = True
             continue
         if in_commands:
@@ -159,20 +196,21 @@ def get_cli_commands_from_help() -> set[str]:
                 break
             token = stripped.split()[0]
             commands.add(token)
-    if not commands:
-        msg = "Failed to parse commands from `simplicitypress --help` output."
-        raise RuntimeError(msg)
     return commands
 
 
 def extract_python_blocks(markdown: str) -> list[PythonBlock]:
     """Locate python fenced code blocks inside Markdown content."""
     blocks: list[PythonBlock] = []
+    # Count newlines incrementally between matches instead of rescanning
+    # the whole prefix for every block.
+    cursor = 0
+    start_line = 1
     for match in PY_BLOCK_PATTERN.finditer(markdown):
         info = match.group("info").strip()
         code = match.group("body")
-        before = markdown[: match.start()]
-        start_line = before.count("\n") + 1
+        start_line += markdown.count("\n", cursor, match.start())
+        cursor = match.start()
         blocks.append(PythonBlock(code=code, start_line=start_line, metadata=info))
     return blocks
 
@@ -208,14 +246,14 @@ def run_python_blocks(blocks: Sequence[PythonBlock]) -> None:
 def textwrap_dedent_preserve(code: str) -> str:
     """Dedent code blocks while preserving leading/trailing blank lines."""
     lines = code.splitlines()
-    if not lines:
-        return ""
     # Remove leading/trailing empty lines for consistent execution.
-    while lines and not lines[0].strip():
-        lines.pop(0)
-    while lines and not lines[-1].strip():
-        lines.pop()
-    return "\n".join(lines)
+    start = 0
+    end = len(lines)
+    while start < end and not lines[start].strip():
+        start += 1
+    while end > start and not lines[end - 1].strip():
+        end -= 1
+    return "\n".join(lines[start:end])
 
 
 def gather_markdown_files() -> list[Path]:
@@ -227,18 +265,26 @@ def gather_markdown_files() -> list[Path]:
     return files
 
 
+def _has_docstring(node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef) -> bool:
+    """True when the first statement of ``node`` is a non-blank string literal."""
+    first = node.body[0] if node.body else None
+    if not isinstance(first, ast.Expr) or not isinstance(first.value, ast.Constant):
+        return False
+    value = first.value.value
+    return isinstance(value, str) and bool(value.strip())
+
+
 def find_missing_docstrings(paths: Sequence[Path]) -> list[str]:
     """Return missing docstring descriptors for public definitions."""
     missing: list[str] = []
     for path in paths:
         source = path.read_text(encoding="utf-8")
-        module = ast.parse(source, filename=str(path))
+        module = ast.parse(source, filename=str(path), type_comments=False)
         for node in module.body:
             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
                 if node.name.startswith("_"):
                     continue
-                docstring = ast.get_docstring(node)
-                if docstring and docstring.strip():
+                if _has_docstring(node):
                     continue
                 missing.append(f"{path}:{node.lineno}:{node.name}")
     return missing
@@ -246,8 +292,8 @@ def find_missing_docstrings(paths: Sequence[Path]) -> list[str]:
 
 def main() -> None:
     """Entry point for the docs audit helper."""
-    markdown_files = gather_markdown_files()
-    mentioned_commands = read_markdown_commands(markdown_files)
+    markdown_texts = read_markdown_texts(gather_markdown_files())
+    mentioned_commands = read_markdown_commands(markdown_texts)
     try:
         cli_commands = get_cli_commands_from_app()
     except Exception as exc:  # noqa: BLE001
@@ -259,8 +305,7 @@ def main() -> None:
         msg = f"Unknown CLI commands referenced in docs: {listed}"
         raise SystemExit(msg)
 
-    readme_path = REPO_ROOT / "README.md"
-    readme_content = remove_no_audit_sections(readme_path.read_text(encoding="utf-8"))
+    readme_content = remove_no_audit_sections(markdown_texts[REPO_ROOT / "README.md"])
     python_blocks = extract_python_blocks(readme_content)
     run_python_blocks(python_blocks)
 
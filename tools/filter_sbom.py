@@ -33,24 +33,25 @@ def main(path: Path) -> int:
         if comp.get("bom-ref") not in pip_refs
     ]
 
-    # Filter dependencies
+    # Filter dependencies, only rebuilding dependsOn lists that mention pip
     filtered_deps = []
     for dep in dependencies:
         if dep.get("ref") in pip_refs:
             continue
-        depends_on = dep.get("dependsOn", [])
-        dep["dependsOn"] = [
-            ref for ref in depends_on
-            if ref not in pip_refs
-        ]
+        depends_on = dep.setdefault("dependsOn", [])
+        if any(ref in pip_refs for ref in depends_on):
+            dep["dependsOn"] = [
+                ref for ref in depends_on
+                if ref not in pip_refs
+            ]
         filtered_deps.append(dep)
 
     data["dependencies"] = filtered_deps
 
-    path.write_text(
-        json.dumps(data, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
+    # Stream through a large buffer instead of building the whole string.
+    with path.open("w", encoding="utf-8", buffering=1024 * 1024) as fh:
+        json.dump(data, fh, indent=2, sort_keys=True)
+        fh.write("\n")
 
     print(f"SBOM filter: removed pip ({len(pip_refs)} component)")
     return 0
@@ -29,6 +29,8 @@ from typing import NoReturn, Sequence
 ROOT = Path(__file__).resolve().parent.parent
 PYPROJECT = ROOT / "pyproject.toml"
 CHANGELOG = ROOT / "CHANGELOG.md"
+VERSION_RE = re.compile(r'(?m)^(version\s*=\s*")([^"]+)(")')
+SEMVER_RE = re.compile(r"^\d+\.\d+(\.\d+)?$")
 
 
 def die(msg: str) -> NoReturn:
@@ -41,8 +43,19 @@ def run(
     check: bool = True,
     capture_output: bool = False,
 ) -> subprocess.CompletedProcess:
+    """
+    Echo and run a short, non-interactive command.
+
+    stdin is closed and inherited fds are left alone (``close_fds=False``)
+    so each spawn skips the fd sweep; not meant for streaming or prompts.
+    """
     print(f"+ {' '.join(cmd)}")
-    kwargs: dict[str, object] = {"check": check, "text": True}
+    kwargs: dict[str, object] = {
+        "check": check,
+        "text": True,
+        "stdin": subprocess.DEVNULL,
+        "close_fds": False,
+    }
     if capture_output:
         kwargs["stdout"] = subprocess.PIPE
         kwargs["stderr"] = subprocess.PIPE
@@ -77,8 +90,7 @@ def update_version_in_pyproject(new_version: str) -> str:
         die("Could not find [project] table in pyproject.toml.")
 
     # Replace the first version = "..."
-    pattern = r'(?m)^(version\s*=\s*")([^"]+)(")'
-    match = re.search(pattern, text)
+    match = VERSION_RE.search(text)
     if not match:
         die('Could not find a `version = "...` line in pyproject.toml.')
 
@@ -89,7 +101,7 @@ def update_version_in_pyproject(new_version: str) -> str:
     def _repl(match: "re.Match[str]") -> str:
         return f'{match.group(1)}{new_version}{match.group(3)}'
 
-    new_text = re.sub(pattern, _repl, text, count=1)
+    new_text = VERSION_RE.sub(_repl, text, count=1)
     PYPROJECT.write_text(new_text, encoding="utf-8")
 
     print(f"Updated version: {old_version} → {new_version}")
@@ -152,7 +164,7 @@ def main(argv: list[str]) -> None:
     new_version = argv[1].strip()
 
     # Very light sanity check: X.Y or X.Y.Z
-    if not re.match(r"^\d+\.\d+(\.\d+)?$", new_version):
+    if not SEMVER_RE.match(new_version):
         die(f"Version {new_version!r} does not look like X.Y or X.Y.Z")
 
     ensure_clean_git()
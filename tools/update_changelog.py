@@ -7,13 +7,18 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import difflib
+import itertools
 import subprocess
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List, Literal, Sequence, overload
 
 SECTION_ORDER = ["Features", "Fixes", "Documentation", "Maintenance", "Other"]
+SECTION_INDEX = {name: idx for idx, name in enumerate(SECTION_ORDER)}
+OTHER_INDEX = SECTION_INDEX["Other"]
 TYPE_TO_SECTION = {
     "feat": "Features",
     "fix": "Fixes",
@@ -26,13 +31,22 @@ TYPE_TO_SECTION = {
     "build": "Maintenance",
     "perf": "Maintenance",
 }
-INTRO_LINES = [
+SKIP_PREFIXES = ("merge ", "chore(release):")
+# Commit types bucketed by first character; no type is a prefix of another,
+# so at most one candidate can match a subject.
+TYPES_BY_FIRST_CHAR = {
+    first: tuple((name, section) for name, section in TYPE_TO_SECTION.items() if name[0] == first)
+    for first in {name[0] for name in TYPE_TO_SECTION}
+}
+MAX_DIFF_LINES = 200
+NORMALIZE_TABLE = str.maketrans({"\r": "\n", "\u202f": " ", "\u00a0": " "})
+INTRO_LINES = (
     "# Changelog",
     "",
     "This file is generated from git history via tools/update_changelog.py.",
     "Releases before v0.2.0 predate that workflow, so earlier sections may not list every historical commit.",
     "",
-]
+)
 
 
 @dataclass
@@ -49,67 +63,77 @@ class RenderInfo:
     unreleased_commits: int
 
 
-def run_git(*args: str) -> str:
-    """Run git and return stdout (stripped)."""
+@overload
+def run_git(*args: str, binary: Literal[False] = ...) -> str: ...
+
+
+@overload
+def run_git(*args: str, binary: Literal[True]) -> bytes: ...
+
+
+def run_git(*args: str, binary: bool = False) -> str | bytes:
+    """Run git and return stdout (stripped).
+
+    ``binary=True`` returns raw bytes so log parsers can split fields and
+    decode only what they keep.  ``close_fds=False`` lets CPython use
+    ``posix_spawn``; this script opens no descriptors of its own, so git
+    inherits nothing it should not see.
+    """
     result = subprocess.run(
         ["git", *args],
         check=True,
-        text=True,
+        text=not binary,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
+        close_fds=False,
     )
     return result.stdout.strip()
 
 
-def list_version_tags() -> List[str]:
+def decode_git(value: bytes) -> str:
+    """Decode git output as UTF-8 regardless of the platform locale."""
+    return value.decode("utf-8", errors="replace")
+
+
+@lru_cache(maxsize=None)
+def list_version_tags() -> tuple[str, ...]:
     output = run_git("tag", "--list", "v*", "--sort=-version:refname")
-    return [line.strip() for line in output.splitlines() if line.strip()]
+    return tuple(line.strip() for line in output.splitlines() if line.strip())
 
 
+@lru_cache(maxsize=None)
 def get_tag_date(tag: str) -> str:
     return run_git("log", "-1", "--date=short", "--pretty=%ad", tag)
 
 
-def should_skip_subject(subject: str) -> bool:
-    lowered = subject.lower()
-    if lowered.startswith("merge "):
-        return True
-    if lowered.startswith("chore(release):"):
-        return True
-    if "update changelog" in lowered:
-        return True
-    if "changelog" in lowered:
-        return True
-    return False
-
-
-def categorize_subject(subject: str) -> str:
-    lowered = subject.lower()
-    if ":" in lowered:
-        prefix = lowered.split(":", 1)[0]
-        if prefix.endswith("!"):
-            prefix = prefix[:-1]
-        if "(" in prefix:
-            prefix = prefix.split("(", 1)[0]
-        if prefix in TYPE_TO_SECTION:
-            return TYPE_TO_SECTION[prefix]
-    for prefix, section in TYPE_TO_SECTION.items():
-        if lowered.startswith(f"{prefix} "):
+def should_skip_subject(subject: str, lowered: str | None = None) -> bool:
+    if lowered is None:
+        lowered = subject.lower()
+    return lowered.startswith(SKIP_PREFIXES) or "changelog" in lowered
+
+
+def categorize_subject(subject: str, lowered: str | None = None) -> str:
+    if lowered is None:
+        lowered = subject.lower()
+    for commit_type, section in TYPES_BY_FIRST_CHAR.get(lowered[:1], ()):
+        if not lowered.startswith(commit_type):
+            continue
+        # "type:", "type!:", "type(scope)...:" or a plain "type " word.
+        marker = lowered[len(commit_type) : len(commit_type) + 2]
+        if marker[:1] in (":", " ") or marker == "!:":
             return section
+        if marker[:1] == "(" and ":" in lowered:
+            return section
+        break
     return "Other"
 
 
-def parse_commit_line(line: str) -> Commit | None:
-    if not line:
-        return None
-    try:
-        short_hash, subject = line.split("\t", 1)
-    except ValueError:
-        return None
+def build_commit(short_hash: str, subject: str) -> Commit | None:
     subject = subject.strip()
-    if not subject or should_skip_subject(subject):
+    lowered = subject.lower()
+    if not subject or should_skip_subject(subject, lowered):
         return None
-    section = categorize_subject(subject)
+    section = categorize_subject(subject, lowered)
     return Commit(short_hash=short_hash, subject=subject, section=section)
 
 
@@ -117,49 +141,133 @@ def gather_commits(range_spec: str | None) -> List[Commit]:
     args = ["log", "--pretty=format:%h%x09%s", "--no-merges"]
     if range_spec:
         args.append(range_spec)
-    output = run_git(*args)
+    output = run_git(*args, binary=True)
     commits: List[Commit] = []
-    for line in output.splitlines():
-        commit = parse_commit_line(line)
+    for line in output.split(b"\n"):
+        short_hash, sep, subject = line.partition(b"\t")
+        if not sep:
+            continue
+        commit = build_commit(short_hash.decode("ascii"), decode_git(subject))
         if commit:
             commits.append(commit)
     return commits
 
 
-def group_commits(commits: Iterable[Commit]) -> dict[str, List[Commit]]:
-    grouped: dict[str, List[Commit]] = {name: [] for name in SECTION_ORDER}
-    for commit in commits:
-        grouped.setdefault(commit.section, []).append(commit)
-    return grouped
-
-
-def format_section(title: str, commits: List[Commit]) -> List[str]:
-    lines: List[str] = [f"## {title}", ""]
+def format_section(title: str, commits: List[Commit]) -> Iterator[str]:
+    yield f"## {title}"
+    yield ""
     if not commits:
-        lines.append("_No notable changes._")
-        lines.append("")
-        return lines
+        yield "_No notable changes._"
+        yield ""
+        return
 
-    grouped = group_commits(commits)
-    for section_name in SECTION_ORDER:
-        section_commits = grouped.get(section_name) or []
+    buckets: List[List[Commit]] = [[] for _ in SECTION_ORDER]
+    for commit in commits:
+        buckets[SECTION_INDEX.get(commit.section, OTHER_INDEX)].append(commit)
+    for section_name, section_commits in zip(SECTION_ORDER, buckets):
         if not section_commits:
             continue
-        lines.append(f"### {section_name}")
-        lines.append("")
+        yield f"### {section_name}"
+        yield ""
         for commit in section_commits:
-            lines.append(f"- {commit.subject} ({commit.short_hash})")
-        lines.append("")
-    return lines
+            yield f"- {commit.subject} ({commit.short_hash})"
+        yield ""
+
+
+def partition_release_log(
+    output: bytes,
+    tags: Sequence[str],
+) -> dict[str, tuple[str, List[Commit]]]:
+    """Split one ``git log`` over every tag into per-release commits and dates.
+
+    A tag lists the commits reachable from it but not from the next older
+    tag, exactly like ``git log older..tag``; a tag missing from the log is
+    left out (along with its newer neighbour) for the caller to query
+    separately.  Merge commits are walked for ancestry but never listed.
+    Full hashes stay as bytes; only the fields that end up in the changelog
+    are decoded.
+    """
+    order: List[bytes] = []
+    parents: dict[bytes, List[bytes]] = {}
+    commits: dict[bytes, Commit] = {}
+    tag_commits: dict[str, bytes] = {}
+    tag_dates: dict[str, str] = {}
+    for line in output.split(b"\n"):
+        fields = line.split(b"\t", 5)
+        if len(fields) != 6:
+            continue
+        full_hash, parent_hashes, refs, short_hash, date_str, subject = fields
+        order.append(full_hash)
+        parents[full_hash] = parent_hashes.split()
+        if refs:
+            for ref in decode_git(refs).split(", "):
+                if ref.startswith("tag: "):
+                    tag_commits[ref[5:]] = full_hash
+                    tag_dates[ref[5:]] = date_str.decode("ascii")
+        if len(parents[full_hash]) > 1:
+            continue
+        commit = build_commit(short_hash.decode("ascii"), decode_git(subject))
+        if commit:
+            commits[full_hash] = commit
+
+    releases: dict[str, tuple[str, List[Commit]]] = {}
+    older_ancestors: set[bytes] | None = set()
+    for tag in reversed(tags):
+        start = tag_commits.get(tag)
+        ancestors = _ancestors(start, parents) if start else None
+        if ancestors is not None and older_ancestors is not None:
+            releases[tag] = (
+                tag_dates[tag],
+                [
+                    commits[full_hash]
+                    for full_hash in order
+                    if full_hash in commits
+                    and full_hash in ancestors
+                    and full_hash not in older_ancestors
+                ],
+            )
+        older_ancestors = ancestors
+    return releases
+
+
+def _ancestors(start: bytes, parents: dict[bytes, List[bytes]]) -> set[bytes]:
+    """Return ``start`` and every commit reachable from it."""
+    seen = {start}
+    stack = [start]
+    while stack:
+        for parent in parents.get(stack.pop(), ()):
+            if parent not in seen:
+                seen.add(parent)
+                stack.append(parent)
+    return seen
+
+
+def gather_release_commits(tags: Sequence[str]) -> dict[str, tuple[str, List[Commit]]]:
+    """Fetch commits and dates for every tag with a single ``git log``."""
+    if not tags:
+        return {}
+    output = run_git(
+        "log",
+        "--date=short",
+        "--decorate-refs=refs/tags/v*",
+        "--pretty=format:%H%x09%P%x09%D%x09%h%x09%ad%x09%s",
+        *tags,
+        binary=True,
+    )
+    return partition_release_log(output, tags)
 
 
-def build_release_sections(tags: List[str]) -> List[List[str]]:
-    sections: List[List[str]] = []
+def build_release_sections(tags: Sequence[str]) -> List[Iterator[str]]:
+    sections: List[Iterator[str]] = []
+    releases = gather_release_commits(tags)
     for idx, tag in enumerate(tags):
-        older = tags[idx + 1] if idx + 1 < len(tags) else None
-        range_spec = f"{older}..{tag}" if older else tag
-        commits = gather_commits(range_spec)
-        date_str = get_tag_date(tag)
+        if tag in releases:
+            date_str, commits = releases[tag]
+        else:
+            older = tags[idx + 1] if idx + 1 < len(tags) else None
+            range_spec = f"{older}..{tag}" if older else tag
+            commits = gather_commits(range_spec)
+            date_str = get_tag_date(tag)
         sections.append(format_section(f"{tag} - {date_str}", commits))
     return sections
 
@@ -167,9 +275,9 @@ def build_release_sections(tags: List[str]) -> List[List[str]]:
 def build_unreleased_section(
     base_ref: str | None,
     include: bool,
-) -> tuple[List[str], str | None, int]:
+) -> tuple[Iterable[str], str | None, int]:
     if not include:
-        return ([], None, 0)
+        return ((), None, 0)
     range_spec = f"{base_ref}..HEAD" if base_ref else None
     commits = gather_commits(range_spec)
     descriptor = range_spec or "<root>..HEAD"
@@ -181,65 +289,99 @@ def render_changelog(
     version_override: str | None = None,
     since_ref: str | None = None,
 ) -> tuple[str, RenderInfo]:
+    """Render the changelog; the returned text is already normalized."""
     tags = list_version_tags()
-    release_sections: List[List[str]] = []
-    latest_ref = since_ref or (tags[0] if tags else None)
+    newest_tag = tags[0] if tags else None
+    tag_pos = {tag: idx for idx, tag in enumerate(tags)}
+    release_sections: List[Iterator[str]] = []
+    latest_ref = since_ref or newest_tag
 
-    if version_override and version_override not in tags:
-        base = since_ref or (tags[0] if tags else None)
+    if version_override and version_override not in tag_pos:
+        base = since_ref or newest_tag
         range_spec = f"{base}..HEAD" if base else None
         commits = gather_commits(range_spec)
         today = dt.date.today().isoformat()
         release_sections.append(format_section(f"{version_override} - {today}", commits))
         latest_ref = "HEAD"
     elif version_override:
-        start_idx = tags.index(version_override)
-        tags = tags[: start_idx + 1]
+        tags = tags[: tag_pos[version_override] + 1]
 
-    lines: List[str] = INTRO_LINES.copy()
     unreleased_lines, range_desc, range_count = build_unreleased_section(
         latest_ref,
         include_unreleased,
     )
-    lines.extend(unreleased_lines)
-    if lines and lines[-1] != "":
-        lines.append("")
     release_sections.extend(build_release_sections(tags))
-    for section in release_sections:
-        lines.extend(section)
-    content = "\n".join(lines).rstrip("\n") + "\n"
+    # Every block ends with a blank line; normalize_text trims the last one.
+    content = "\n".join(itertools.chain(INTRO_LINES, unreleased_lines, *release_sections))
     info = RenderInfo(
         latest_tag=latest_ref,
         unreleased_range=range_desc,
         unreleased_commits=range_count,
     )
-    return content.replace("\r\n", "\n"), info
+    return normalize_text(content), info
 
 
 def normalize_text(text: str) -> str:
-    normalized = text.replace("\r\n", "\n").replace("\r", "\n")
-
-    # Normalize “weird spaces”
-    normalized = normalized.replace("\u202f", " ")
-    normalized = normalized.replace("\u00a0", " ")
+    # Bare CR and “weird spaces” in one translate pass
+    normalized = text.replace("\r\n", "\n").translate(NORMALIZE_TABLE)
 
     # Handle historical mojibake
-    normalized = normalized.replace("â€¯", " ")  # U+202F that got mangled
-    normalized = normalized.replace("â†’", "→")  # arrow that got mangled
+    if "â" in normalized:
+        normalized = normalized.replace("â€¯", " ")  # U+202F that got mangled
+        normalized = normalized.replace("â†’", "→")  # arrow that got mangled
 
     return normalized.rstrip("\n") + "\n"
 
 
-def write_changelog(content: str, path: Path) -> None:
-    normalized = normalize_text(content)
+def _write_atomic(normalized: str, path: Path) -> None:
+    """Write already-normalized changelog text via a temp file and rename."""
     tmp_path = path.with_suffix(".tmp")
-    tmp_path.write_text(normalized, encoding="utf-8", newline="\n")
+    # normalize_text already produced LF-only text, so skip the text layer.
+    tmp_path.write_bytes(normalized.encode("utf-8"))
     tmp_path.replace(path)
 
 
+def check_changelog(content: str, path: Path) -> str | None:
+    """Return None when ``path`` holds ``content``, else its normalized text.
+
+    The file is read once.  Comparing raw bytes first only saves work when
+    the sizes already agree; a size mismatch still needs the normalized
+    comparison, since a CRLF checkout differs in size yet matches.  A
+    missing file yields an empty string.
+    """
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return ""
+    if raw == content.encode("utf-8"):
+        return None
+    existing = normalize_text(raw.decode("utf-8"))
+    return None if existing == content else existing
+
+
+def print_changelog_diff(content: str, existing: str, path: Path) -> None:
+    """Stream up to MAX_DIFF_LINES of a unified diff to the generated ``content``."""
+    diff = difflib.unified_diff(
+        existing.splitlines(keepends=True),
+        content.splitlines(keepends=True),
+        fromfile=str(path),
+        tofile=f"{path} (generated)",
+    )
+    sys.stdout.writelines(itertools.islice(diff, MAX_DIFF_LINES))
+    remaining = sum(1 for _ in diff)
+    if remaining:
+        print(f"... {remaining} more diff lines omitted")
+
+
 def parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Update SimplicityPress changelog.")
-    parser.add_argument("--update", action="store_true", help="Rewrite CHANGELOG.md")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--update", action="store_true", help="Rewrite CHANGELOG.md")
+    mode.add_argument(
+        "--check",
+        action="store_true",
+        help="Fail if the changelog differs from the generated output",
+    )
     parser.add_argument("--version", help="Regenerate up to a specific version/tag")
     parser.add_argument(
         "--since",
@@ -257,8 +399,8 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         help="Override the changelog path (default: CHANGELOG.md)",
     )
     args = parser.parse_args(argv)
-    if not args.update:
-        parser.error("Pass --update to rewrite the changelog.")
+    if not (args.update or args.check):
+        parser.error("Pass --update to rewrite the changelog or --check to verify it.")
     return args
 
 
@@ -270,9 +412,14 @@ def main(argv: list[str] | None = None) -> int:
         version_override=args.version,
         since_ref=args.since,
     )
-    normalized_content = normalize_text(content)
-    if args.update:
-        write_changelog(normalized_content, output_path)
+    if args.check:
+        existing = check_changelog(content, output_path)
+        if existing is None:
+            return 0
+        print(f"{output_path} is out of date; run with --update.", file=sys.stderr)
+        print_changelog_diff(content, existing, output_path)
+        return 1
+    _write_atomic(content, output_path)
     return 0
 
 